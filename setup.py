@@ -1,6 +1,24 @@
-#!/usr/bin/env python
-
-import setuptools
-
-if __name__ == "__main__":
-    setuptools.setup()
\ No newline at end of file
+#!/usr/bin/env python
+
+import os
+
+import setuptools
+
+
+def _ext_modules():
+    # Opt-in ahead-of-time compilation: the type introspection walks in silberstral.py are pure-Python
+    # attribute chasing, which mypyc can compile to native code. The compiled extension is entirely
+    # optional; without the opt-in (or without mypyc installed) the package is shipped as plain Python
+    if os.environ.get("SILBERSTRAL_COMPILE") != "1":
+        return []
+
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        return []
+
+    return mypycify(["src/silberstral/silberstral.py"])
+
+
+if __name__ == "__main__":
+    setuptools.setup(ext_modules=_ext_modules())
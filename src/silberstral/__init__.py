@@ -1,2 +1,2 @@
 from .silberstral import reveal_type_var, reveal_type_vars, get_origin, gather_types, \
-    is_type_var_instantiated, save_instantiate
+    is_type_var_instantiated, save_instantiate, precompute_type_vars
@@ -1,13 +1,61 @@
 import sys
+import weakref
+from collections import deque
 from dataclasses import is_dataclass
+from functools import lru_cache
 from inspect import isclass
+from types import MappingProxyType
 from typing import Type, Union, TypeVar, Generic, Iterable, Set, get_type_hints, Optional, \
-    _GenericAlias, Dict, Collection
+    _GenericAlias, Dict, Collection, Tuple
 
 from dacite.types import is_generic_collection, extract_generic, is_union, is_generic
 
 _T_TypeVar = TypeVar('_T_TypeVar', bound=TypeVar)
 
+# Resolve version-dependent constants once at import time instead of on every call
+_PY39 = sys.version_info >= (3, 9)
+try:
+    # Only exists in Python >= 3.9 where it replaces the _special flag on built-in generic aliases
+    from typing import _SpecialGenericAlias as _SPECIAL_ALIAS
+except ImportError:
+    _SPECIAL_ALIAS = ()
+
+try:
+    # Only available in Python >= 3.8
+    from typing import get_args as _get_args
+except ImportError:
+    def _get_args(obj_or_cls: Union[object, Type, _GenericAlias]):
+        # Python 3.7 does not have typing.get_args() yet
+        return obj_or_cls.__args__
+
+_TYPING_MODULE = sys.modules['typing']
+# Maps the _name attribute of typing's internal generic aliases (e.g., 'List', 'Iterable') to the corresponding
+# typing attribute, so get_origin() can resolve them with a single lookup into a small dict
+_TYPING_BY_NAME = {public_name: getattr(_TYPING_MODULE, public_name) for public_name in _TYPING_MODULE.__all__}
+
+# Sentinel for getattr() probes, so that attribute presence and value can be checked with a single lookup
+_MISSING = object()
+
+# Caches the __parameters__ tuple per generic base class. Weak keys ensure the cache does not keep user classes alive
+_PARAMS_CACHE = weakref.WeakKeyDictionary()
+
+# Shared read-only result for non-generic inputs, avoiding a fresh dict allocation on the most common early exit
+_NO_TYPE_VAR_INSTANTIATIONS = MappingProxyType({})
+
+# Canonical instances of generic aliases, keyed by (origin, args). Alias expressions like Cls[int] create a fresh
+# object on every evaluation, so without interning equivalent queries would never hit the id-keyed reveal cache.
+# Weak values keep the interned aliases collectable
+_ALIAS_INTERN = weakref.WeakValueDictionary()
+
+# Caches the {TypeVar: Type} mapping gathered from a class's base class hierarchy. A class's __orig_bases__ are
+# fixed once the class is built, so entries never need to be invalidated; weak keys keep user classes collectable
+_GATHERED_CACHE = weakref.WeakKeyDictionary()
+
+# Classes and generic aliases are effectively immutable, so their type var resolutions are cached here (keyed by id)
+# to avoid re-walking the __orig_bases__ hierarchy on every reveal_type_var()/reveal_type_vars() call.
+# Each entry holds the resolved {TypeVar: Type} mapping plus a {name: Type} index for the by-name fallback lookup
+_REVEAL_CACHE: Dict[int, Tuple[Dict[TypeVar, Type], Dict[str, Type]]] = {}
+
 
 # =========================================================================
 # Generic Methods
@@ -33,40 +81,40 @@ def get_origin(tp: _GenericAlias) -> Union[Type, None]:
         The corresponding generic base type of the passed class
     """
 
-    if hasattr(tp, '_name') and tp._name is not None:
-        try:
-            from typing import _SpecialGenericAlias
-        except ImportError:
-            pass
-
-        if sys.version_info < (3, 9) and tp._special or sys.version_info >= (3, 9) and isinstance(tp,
-                                                                                                  _SpecialGenericAlias):
-            # _special = True for Python's internal generic base class
-            # e.g., Iterable: _special = True
-            # Iterable[str]: _special = False
-            # In Python >= 3.9, this flag was replaced with _SpecialGenericAlias
-            return None
-        else:
-            # Internal Python generic types (such as List[], Iterable[]) are implemented slightly hacky.
-            # When typing.get_origin() is called on them, the don't return the actual generic base type, but the
-            # implementation from the collections module which lack TypeVars
-            # (e.g., typing.Iterable[T] -> collections.Iterable).
-            # To get the actual generic base type (i.e., typing.Iterable[T] -> typing.Iterable) exploit the _name
-            # attribute that is set on Python's internal types and that directly links to the name of the correct
-            # type in the typing module (which has generics)
-            typing_modules = sys.modules['typing']
-            if hasattr(typing_modules, tp._name):
-                return getattr(typing_modules, tp._name)
-
     # Only works in Python >= 3.8
     # origin_cls = typing.get_origin(tp)
-    if hasattr(tp, '__origin__'):
-        # Get generic origin class
-        return tp.__origin__
-    else:
+    # The overwhelmingly common case are user-defined generics which carry their generic base class directly in
+    # __origin__ and have no _name set, so probe __origin__ first with a single attribute read
+    origin = getattr(tp, '__origin__', None)
+    if origin is None:
         # The passed type does not correspond to a _GenericAlias
         return None
 
+    name = getattr(tp, '_name', None)
+    if name is None:
+        # Get generic origin class
+        return origin
+
+    if not _PY39 and tp._special or _PY39 and isinstance(tp, _SPECIAL_ALIAS):
+        # _special = True for Python's internal generic base class
+        # e.g., Iterable: _special = True
+        # Iterable[str]: _special = False
+        # In Python >= 3.9, this flag was replaced with _SpecialGenericAlias
+        return None
+
+    # Internal Python generic types (such as List[], Iterable[]) are implemented slightly hacky.
+    # When typing.get_origin() is called on them, the don't return the actual generic base type, but the
+    # implementation from the collections module which lack TypeVars
+    # (e.g., typing.Iterable[T] -> collections.Iterable).
+    # To get the actual generic base type (i.e., typing.Iterable[T] -> typing.Iterable) exploit the _name
+    # attribute that is set on Python's internal types and that directly links to the name of the correct
+    # type in the typing module (which has generics)
+    resolved = _TYPING_BY_NAME.get(name)
+    if resolved is not None:
+        return resolved
+
+    return origin
+
 
 def reveal_type_vars(obj_or_cls: Union[object, Type, _GenericAlias]) -> Dict[TypeVar, Type]:
     """
@@ -89,39 +137,11 @@ def reveal_type_vars(obj_or_cls: Union[object, Type, _GenericAlias]) -> Dict[Typ
 
     Returns
     -------
-        A dictionary that is mapping every type var to its instantiation
+        A dictionary that is mapping every type var to its instantiation.
+        For classes and generic aliases, the returned mapping is cached and should be treated as read-only
     """
 
-    type_var_instantiations = dict()
-    cls_origin = get_origin(obj_or_cls)
-
-    if cls_origin is not None:
-        # The passed object is actually a generic class
-
-        if sys.version_info >= (3, 9):
-            # built-in containers, e.g., List, Dict, do not have TypeVars anymore in Python >= 3.9
-            # Instead, they have "anonymous" generics that are just parameterized by the number of type vars
-            # In this case, the only thing we can do is enumerate the instantiations without mapping them to a type var
-            from typing import _SpecialGenericAlias
-            if isinstance(cls_origin, _SpecialGenericAlias):
-                type_var_instantiations = dict(enumerate(obj_or_cls.__args__))
-                return type_var_instantiations
-
-        generic_types = _get_args(obj_or_cls)
-        generic_type_vars = cls_origin.__parameters__
-        type_var_instantiations = _pack_type_var_instantiations(generic_type_vars, generic_types)
-    elif hasattr(obj_or_cls, "__orig_class__") and hasattr(obj_or_cls, "__parameters__"):
-        # The passed object is an instance of a direct generic type, i.e., directly subclasses Generic[...]
-        generic_types = _get_args(obj_or_cls.__orig_class__)
-        generic_type_vars = obj_or_cls.__parameters__
-        type_var_instantiations = _pack_type_var_instantiations(generic_type_vars, generic_types)
-    elif hasattr(obj_or_cls, "__orig_bases__"):
-        # The passed object is not itself a generic type, but inherits from templated types
-
-        # Gather all typevars and their associated types of all superclasses of the passed object
-        _rec_gather_generics(obj_or_cls, type_var_instantiations)
-
-    return type_var_instantiations
+    return _reveal(obj_or_cls)[0]
 
 
 def reveal_type_var(obj_or_cls: Union[object, Type, _GenericAlias],
@@ -160,7 +180,29 @@ def reveal_type_var(obj_or_cls: Union[object, Type, _GenericAlias],
         the instantiated class for the respective `type_var` of the templated `obj_or_cls`
     """
 
-    type_var_instantiations = reveal_type_vars(obj_or_cls)
+    if type(type_var) is int:
+        # Fast path for the index shortcut: the answer only depends on the __args__ tuple of the passed alias
+        # (or of the instance's __orig_class__), so the full type var instantiation dict does not have to be built
+        generic_args = getattr(obj_or_cls, '__args__', None)
+        if generic_args is None:
+            generic_args = getattr(getattr(obj_or_cls, '__orig_class__', None), '__args__', None)
+        if generic_args is not None:
+            return generic_args[type_var]
+
+    if isinstance(obj_or_cls, _GenericAlias):
+        # Fast path for fully parameterized aliases, e.g., reveal_type_var(MyContainer[MySample], T):
+        # the answer is a one-level zip of the origin's parameters with the alias arguments. Alias expressions
+        # are created fresh on every evaluation, so this avoids populating the id-keyed cache with short-lived
+        # entries for the most common query shape
+        cls_origin = get_origin(obj_or_cls)
+        if cls_origin is not None and not isinstance(cls_origin, _SPECIAL_ALIAS):
+            generic_args = _get_args(obj_or_cls)
+            if generic_args and not any(type(t) is TypeVar for t in generic_args):
+                direct_instantiations = dict(zip(_parameters(cls_origin), generic_args))
+                if type_var in direct_instantiations:
+                    return direct_instantiations[type_var]
+
+    type_var_instantiations, name_index = _reveal(obj_or_cls)
     # If none of the above cases occurred, the passed object apparently was not a templated type
     assert len(type_var_instantiations) > 0, \
         f"Could not determine template types of `{obj_or_cls}`. Is it a generic type or instance?"
@@ -171,16 +213,44 @@ def reveal_type_var(obj_or_cls: Union[object, Type, _GenericAlias],
         # Type var could be directly matched
         return type_var_instantiations[type_var]
     else:
-        # Try to find type var by name
-        type_var_instantiation_items = type_var_instantiations.items()
-        matching_type_var_instantiations = [tv_instantiation
-                                            for tv, tv_instantiation
-                                            in type_var_instantiation_items
-                                            if tv.__name__ == type_var.__name__]
-        assert len(matching_type_var_instantiations) == 1, \
+        # Try to find type var by name (e.g., for linked type vars, see create_linked_type_var()).
+        # For cached classes/aliases the name index was already built alongside the instantiation mapping
+        if name_index is None:
+            name_index = _build_name_index(type_var_instantiations)
+        assert type_var.__name__ in name_index, \
             f"Could not find typevar `{type_var}` for `{obj_or_cls}"
 
-        return matching_type_var_instantiations[0]
+        return name_index[type_var.__name__]
+
+
+def precompute_type_vars(cls: Type) -> Type:
+    """
+    Eagerly resolves the type vars of `cls` so that later `reveal_type_var()` calls only pay a cache lookup.
+    Resolution results are cached per class anyway, so this merely moves the one-time cost of walking the base class
+    hierarchy from the first lookup to class-creation time, which can be preferable in latency-sensitive code paths.
+    Can be used as a class decorator.
+
+    Examples
+    --------
+        >>> T = TypeVar("T")
+        >>> class TemplatedClass(Generic[T]):
+        >>>     pass
+        >>> @precompute_type_vars
+        >>> class ResolvedClass(TemplatedClass[int]):
+        >>>     pass
+
+    Parameters
+    ----------
+    cls:
+        the class whose type var resolution should be precomputed
+
+    Returns
+    -------
+        the passed class, unchanged
+    """
+
+    reveal_type_vars(cls)
+    return cls
 
 
 def is_type_var_instantiated(obj_or_cls: Union[object, Type, _GenericAlias], type_var: TypeVar) -> bool:
@@ -225,36 +295,48 @@ def gather_types(types: Union[Iterable[Type], Type], parent_type: Optional[Type]
 
     # Ensure that types is iterable
     # TODO: is_generic_collection(types) fails with "unhashable type: 'list'" for dacite > 1.7.0
-    if is_generic_collection(types) or is_generic(types) or isclass(types):
+    if is_generic_collection(types) or is_generic(types) or isinstance(types, type):
         types = [types]
 
     all_types = set()
-    _gather_types_recursive(types, all_types, parent_type=parent_type)
+    _gather_types(types, all_types, parent_type=parent_type)
     return all_types
 
 
-def _gather_types_recursive(types: Union[Iterable[Type], Type],
-                            collected_types: Set[Type],
-                            parent_type: Optional[Type] = None,
-                            ):
-    for t in types:
+def _gather_types(types: Union[Iterable[Type], Type],
+                  collected_types: Set[Type],
+                  parent_type: Optional[Type] = None,
+                  ):
+    # Iterative worklist traversal. Each entry carries its own parent type since the parent changes when descending
+    # into a dataclass. Visited types are tracked by id so that shared or cyclic type graphs (e.g., recursive
+    # dataclasses) are expanded at most once
+    worklist = deque((t, parent_type) for t in types)
+    visited = set()
+    while worklist:
+        t, parent = worklist.popleft()
         # t = t if inspect.isclass(t) else type(t)  # Ensure that passed value is a class
         # TODO: wrt parent_type: maybe we don't want to allow GenericAliases in dataclasses?
-        if is_generic_collection(t) or is_union(t):
-            extracted_types = set(extract_generic(t))
-            extracted_types.difference_update(collected_types)
-            _gather_types_recursive(extracted_types, collected_types, parent_type=parent_type)
+        if isinstance(t, type) and not is_dataclass(t):
+            # Plain concrete classes (int, str, user classes, ...) are by far the most common case, so filter
+            # them out with a cheap C-level check before any of the more expensive dacite predicates run
+            collected_types.add(t)
+        elif type(t) is TypeVar:
+            # type(t) is TypeVar skips the __instancecheck__ dispatch of isinstance(); TypeVar is never subclassed
+            t = reveal_type_var(parent, t)
+            collected_types.add(t)
+        elif is_generic_collection(t) or is_union(t):
+            if id(t) in visited:
+                continue
+            visited.add(id(t))
+            for extracted_type in extract_generic(t):
+                worklist.append((extracted_type, parent))
         elif is_dataclass(t):
-            # TODO: Could get some infinite recursion here. Maybe track visited types?
-            field_types = get_type_hints(t).values()
-            field_types = set(field_types)
-            field_types.difference_update(collected_types)
+            if id(t) in visited:
+                continue
+            visited.add(id(t))
             collected_types.add(t)  # For dataclasses, also add the type of the dataclass, not only the containing types
-            # Important that t is first added to collected_types. Otherwise, we might get infinite recursion
-            _gather_types_recursive(field_types, collected_types, parent_type=t)
-        elif isinstance(t, TypeVar):
-            t = reveal_type_var(parent_type, t)
-            collected_types.add(t)
+            for field_type in _dataclass_field_types(t):
+                worklist.append((field_type, t))
         else:
             collected_types.add(t)
 
@@ -348,62 +430,241 @@ def create_linked_type_var(other_type_var: TypeVar,
 # Helper Methods
 # =========================================================================
 
-def _rec_gather_generics(cls: Union[object, Type], type_var_instantiations: Dict[TypeVar, Type]):
-    # It can happen that a class without base classes was passed. In this case, don't do anything
-    base_classes = cls.__orig_bases__ if hasattr(cls, '__orig_bases__') else []
-    for base_class in base_classes:
-        erased_class = get_origin(base_class)
-        if erased_class == Generic:
-            # Don't visit Generic superclasses as these are already implicitly handled by the subclass
-            continue
-        if erased_class is not None:
-            # Current super class is a templated type. Hence, we can gather type vars and template instantiations
-            type_instantiations = _get_args(base_class)
-            type_vars = None
-            if sys.version_info >= (3, 9):
+@lru_cache(maxsize=None)
+def _dataclass_field_types(t: Type) -> Tuple[Type, ...]:
+    # get_type_hints() re-evaluates string annotations and walks the MRO on every call, but dataclass annotations
+    # don't change at runtime, so the result can be cached indefinitely.
+    # A tuple is returned (instead of the dict values view) so that the cached value is immutable
+    return tuple(get_type_hints(t).values())
+
+
+def _intern_alias(alias: _GenericAlias) -> _GenericAlias:
+    try:
+        key = (alias.__origin__, alias.__args__)
+    except AttributeError:
+        # Bare aliases like typing.List carry no __args__ and need no interning
+        return alias
+
+    try:
+        canonical = _ALIAS_INTERN.get(key)
+    except TypeError:
+        # Unhashable args -> the alias cannot be interned
+        return alias
+
+    if canonical is None:
+        _ALIAS_INTERN[key] = alias
+        return alias
+
+    return canonical
+
+
+def _reveal(obj_or_cls: Union[object, Type, _GenericAlias]) -> Tuple[Dict[TypeVar, Type], Optional[Dict[str, Type]]]:
+    if isinstance(obj_or_cls, _GenericAlias):
+        # Map equivalent alias expressions to one canonical instance so that they share a single cache entry
+        obj_or_cls = _intern_alias(obj_or_cls)
+
+    if isclass(obj_or_cls) or isinstance(obj_or_cls, _GenericAlias):
+        # Classes and generic aliases never change their type var instantiations, so the result can be cached.
+        # Keying on id() is safe as long as the cache entry is evicted once the class/alias is garbage collected
+        # (otherwise the id could be reused by an unrelated object)
+        cache_key = id(obj_or_cls)
+        cached = _REVEAL_CACHE.get(cache_key)
+        if cached is None:
+            type_var_instantiations = _compute_type_var_instantiations(obj_or_cls)
+            if type(type_var_instantiations) is dict:
+                # Freshly gathered mappings are frozen before caching; _NO_TYPE_VAR_INSTANTIATIONS already is
+                type_var_instantiations = MappingProxyType(type_var_instantiations)
+            cached = (type_var_instantiations, _build_name_index(type_var_instantiations))
+            try:
+                weakref.finalize(obj_or_cls, _REVEAL_CACHE.pop, cache_key, None)
+            except TypeError:
+                # obj_or_cls cannot be weak-referenced -> caching under its id would not be safe
+                pass
+            else:
+                _REVEAL_CACHE[cache_key] = cached
+
+        return cached
+
+    # Instances may carry per-instance type information (__orig_class__), so they are not cached.
+    # The name index is only built on demand by reveal_type_var()
+    return _compute_type_var_instantiations(obj_or_cls), None
+
+
+def _build_name_index(type_var_instantiations: Dict[TypeVar, Type]) -> Dict[str, Type]:
+    # Integer keys stemming from the anonymous built-in generics (Python >= 3.9) carry no name and are skipped
+    return {type_var.__name__: instantiation
+            for type_var, instantiation in type_var_instantiations.items()
+            if type(type_var) is TypeVar}
+
+
+def _parameters(cls: Union[Type, _GenericAlias]) -> Tuple[TypeVar, ...]:
+    # The __parameters__ descriptor is re-read for the same base classes over and over during type var resolution,
+    # so the tuple is cached per class
+    parameters = _PARAMS_CACHE.get(cls)
+    if parameters is None:
+        parameters = cls.__parameters__
+        try:
+            _PARAMS_CACHE[cls] = parameters
+        except TypeError:
+            # cls cannot be weak-referenced -> just fall back to the direct attribute read
+            pass
+    return parameters
+
+
+def _compute_type_var_instantiations(obj_or_cls: Union[object, Type, _GenericAlias]) -> Dict[TypeVar, Type]:
+    # Non-generic inputs fall through all branches below, so start out with the shared empty mapping and only
+    # allocate a dict where instantiations are actually gathered
+    type_var_instantiations = _NO_TYPE_VAR_INSTANTIATIONS
+    cls_origin = get_origin(obj_or_cls)
+
+    if cls_origin is not None:
+        # The passed object is actually a generic class
+
+        # built-in containers, e.g., List, Dict, do not have TypeVars anymore in Python >= 3.9
+        # Instead, they have "anonymous" generics that are just parameterized by the number of type vars
+        # In this case, the only thing we can do is enumerate the instantiations without mapping them to a type var
+        # (on Python < 3.9, _SPECIAL_ALIAS is an empty tuple, so the isinstance check is simply always False)
+        if isinstance(cls_origin, _SPECIAL_ALIAS):
+            # The integer keys are part of the public reveal_type_vars() contract (callers look type vars up by
+            # position), so they live in the same mapping as regular TypeVar keys rather than a separate list
+            type_var_instantiations = dict(enumerate(obj_or_cls.__args__))
+            return type_var_instantiations
+
+        generic_types = _get_args(obj_or_cls)
+        generic_type_vars = _parameters(cls_origin)
+        if any(type(t) is TypeVar for t in generic_types):
+            type_var_instantiations = _pack_type_var_instantiations(generic_type_vars, generic_types)
+        else:
+            # Fully instantiated alias (the common case): dict(zip(...)) builds the mapping at C speed without
+            # the per-element TypeVar filtering of _pack_type_var_instantiations
+            type_var_instantiations = dict(zip(generic_type_vars, generic_types))
+    else:
+        orig_class = getattr(obj_or_cls, "__orig_class__", _MISSING)
+        generic_type_vars = getattr(obj_or_cls, "__parameters__", _MISSING)
+        if orig_class is not _MISSING and generic_type_vars is not _MISSING:
+            # The passed object is an instance of a direct generic type, i.e., directly subclasses Generic[...]
+            generic_types = _get_args(orig_class)
+            if any(type(t) is TypeVar for t in generic_types):
+                type_var_instantiations = _pack_type_var_instantiations(generic_type_vars, generic_types)
+            else:
+                type_var_instantiations = dict(zip(generic_type_vars, generic_types))
+        elif getattr(obj_or_cls, "__orig_bases__", _MISSING) is not _MISSING:
+            # The passed object is not itself a generic type, but inherits from templated types
+
+            # Gather all typevars and their associated types of all superclasses of the passed object.
+            # The resolution only depends on the class, so instances share their class's cached result
+            cls = obj_or_cls if isclass(obj_or_cls) else type(obj_or_cls)
+            type_var_instantiations = _gather_generics(cls)
+
+    return type_var_instantiations
+
+
+@lru_cache(maxsize=4096)
+def _origin_cached(base_class: _GenericAlias) -> Union[Type, None]:
+    # The same base class aliases are passed to get_origin() over and over across unrelated resolutions
+    # (shared parent classes), so the result is memoized. The bounded cache keeps the strong references
+    # held by lru_cache from growing without limit
+    return get_origin(base_class)
+
+
+@lru_cache(maxsize=4096)
+def _args_cached(base_class: _GenericAlias) -> Tuple[Type, ...]:
+    return _get_args(base_class)
+
+
+def _gather_generics(cls: Union[Type, _GenericAlias],
+                     _get_origin=_origin_cached,
+                     _get_args=_args_cached,
+                     _Generic=Generic) -> Dict[TypeVar, Type]:
+    # The default arguments bind the hot globals as locals, so the loop below resolves them via LOAD_FAST
+    # instead of a dict lookup per iteration
+    try:
+        cached = _GATHERED_CACHE.get(cls)
+    except TypeError:
+        # cls cannot be weak-referenced -> compute the mapping without caching it
+        cached = _MISSING
+    if cached is not None and cached is not _MISSING:
+        return cached
+
+    # Walk the __orig_bases__ hierarchy iteratively with an explicit worklist instead of recursing.
+    # This avoids a Python frame per visited base class and cannot hit the recursion limit on deep hierarchies.
+    # Popping from the left makes the walk breadth-first, so classes closer to cls claim their type var slots
+    # before more distant ancestors are visited
+    type_var_instantiations = dict()
+    worklist = deque((cls,))
+    # Diamond hierarchies reach shared ancestors multiple times. Equivalent parameterized bases (same origin and
+    # args) contribute identical entries, and the bases of an erased class are independent of the path taken to
+    # it, so both are only processed once per walk. Differently parameterized aliases of the same origin are
+    # still packed individually, which keeps the conflict detection in _pack_type_var_instantiations intact
+    visited_bases = set()
+    visited_classes = set()
+    while worklist:
+        current_cls = worklist.popleft()
+        # It can happen that a class without base classes is encountered. In this case, don't do anything
+        for base_class in getattr(current_cls, '__orig_bases__', ()):
+            if base_class in visited_bases:
+                continue
+            visited_bases.add(base_class)
+            erased_class = _get_origin(base_class)
+            if erased_class is _Generic:
+                # Don't visit Generic superclasses as these are already implicitly handled by the subclass
+                continue
+            if erased_class is not None:
+                # Current super class is a templated type. Hence, we can gather type vars and template instantiations
+                type_instantiations = _get_args(base_class)
+                type_vars = None
                 # built-in containers, e.g., List, Dict, do not have TypeVars anymore in Python >= 3.9
                 # Instead, they have "anonymous" generics that are just parameterized by the number of type vars
                 # In this case, the only thing we can do is enumerate the instantiations without mapping them to a type var
-                from typing import _SpecialGenericAlias
-                if isinstance(erased_class, _SpecialGenericAlias):
-                    type_vars = range(len(type_var_instantiations),
-                                      len(type_var_instantiations) + len(type_instantiations))
+                if isinstance(erased_class, _SPECIAL_ALIAS):
+                    num_collected = len(type_var_instantiations)
+                    type_vars = range(num_collected, num_collected + len(type_instantiations))
+
+                if type_vars is None:
+                    # For non built-in types or Python < 3.9
+                    type_vars = _parameters(erased_class)
+
+                # Collect instantiations for this type
+                _pack_type_var_instantiations(type_vars, type_instantiations, type_var_instantiations)
+                if erased_class not in visited_classes:
+                    visited_classes.add(erased_class)
+                    worklist.append(erased_class)
 
-            if type_vars is None:
-                # For non built-in types or Python < 3.9
-                type_vars = erased_class.__parameters__
+    # The cached mapping is shared across callers, so freeze it before handing it out
+    type_var_instantiations = MappingProxyType(type_var_instantiations)
+    if cached is None:
+        _GATHERED_CACHE[cls] = type_var_instantiations
 
-            # Collect instantiations for this type
-            _pack_type_var_instantiations(type_vars, type_instantiations, type_var_instantiations)
-            _rec_gather_generics(erased_class, type_var_instantiations)
+    return type_var_instantiations
 
 
 def _pack_type_var_instantiations(type_vars: Collection[TypeVar],
                                   type_instantiations: Collection[Type],
-                                  type_var_instantiations=None):
-    if type_var_instantiations is None:
-        type_var_instantiations = dict()
-
+                                  type_var_instantiations: Optional[Dict[TypeVar, Type]] = None,
+                                  _TypeVar=TypeVar) -> Dict[TypeVar, Type]:
     assert len(type_instantiations) == len(type_vars), \
         f"Found different number of type vars ({type_vars}) and instantiations ({type_instantiations})"
-    for type_var, type_instantiation in zip(type_vars, type_instantiations):
-        if not isinstance(type_instantiation, TypeVar):
-            if type_var in type_var_instantiations:
-                assert type_var_instantiations[type_var] == type_instantiation, \
-                    f"Mismatch for TypeVar {type_var}: " \
-                    f"{type_var_instantiations[type_var]} and {type_instantiation}. " \
-                    f"Is the {type_var} always instantiated with the same type?"
-            else:
-                type_var_instantiations[type_var] = type_instantiation
+
+    # Build the new entries in one comprehension (a single C-level pass over the zip) instead of a
+    # per-element Python loop with membership tests. TypeVar is never subclassed in practice, so the
+    # locally bound type(x) is _TypeVar check replaces the isinstance dispatch per zipped pair
+    new_instantiations = {type_var: type_instantiation
+                          for type_var, type_instantiation in zip(type_vars, type_instantiations)
+                          if type(type_instantiation) is not _TypeVar}
+
+    if type_var_instantiations is None:
+        return new_instantiations
+
+    # Merge into the shared accumulator, checking consistency against already collected instantiations
+    for type_var, type_instantiation in new_instantiations.items():
+        existing = type_var_instantiations.setdefault(type_var, type_instantiation)
+        # Identity check first: type vars are almost always re-bound to the very same class object, which
+        # short-circuits before the rich-comparison dispatch of ==
+        assert existing is type_instantiation or existing == type_instantiation, \
+            f"Mismatch for TypeVar {type_var}: " \
+            f"{existing} and {type_instantiation}. " \
+            f"Is the {type_var} always instantiated with the same type?"
 
     return type_var_instantiations
 
 
-def _get_args(obj_or_cls: Union[object, Type, _GenericAlias]):
-    try:
-        # Only available in Python >= 3.8
-        from typing import get_args
-        return get_args(obj_or_cls)
-    except ImportError:
-        # Python >= 3.7
-        return obj_or_cls.__args__
@@ -4,7 +4,8 @@ from typing import TypeVar, Generic, Iterable, Iterator, T_co, Container, Collec
     T, KT, VT, T_contra, V_co, Union, Optional
 from unittest import TestCase
 
-from silberstral import reveal_type_var, get_origin, gather_types, reveal_type_vars, save_instantiate
+from silberstral import reveal_type_var, get_origin, gather_types, reveal_type_vars, save_instantiate, \
+    precompute_type_vars
 from silberstral.silberstral import create_linked_type_var
 
 _T1 = TypeVar('_T1')
@@ -415,6 +416,14 @@ class GenericTest(TestCase):
 
         self.assertEqual(gather_types(RecursiveDataclass), {str, RecursiveDataclass, type(None)})
 
+    def test_precompute_type_vars(self):
+        @precompute_type_vars
+        class PrecomputedTypeVar1(SuperClass1TypeVar[Value1]):
+            pass
+
+        self.assertEqual(reveal_type_var(PrecomputedTypeVar1, _T1), Value1)
+        self.assertEqual(reveal_type_vars(PrecomputedTypeVar1), {_T1: Value1})
+
     def test_override_type_var_middle_class(self):
         obj: MiddleClass1TypeVarBConstructor = save_instantiate(MiddleClass1TypeVarBConstructor[Value1])
         self.assertEqual(obj.cls_T1, Value1)